@@ -11,10 +11,16 @@ from pathlib import Path
 # This makes the application portable and prevents path errors on different computers.
 ASSETS_PATH = Path(__file__).parent / "assets"
 
+# --- LOGIN WINDOW ---
+# Bounding box of the downscaled copy of the background used for live-resize drafts.
+DRAFT_IMAGE_MAX_SIZE = (960, 960)
+
 # --- SIMULATION PARAMETERS ---
 INITIAL_TARGET_LOCATION = (100.0, 200.0, 300.0)
 SIMULATION_TICK_RATE_HZ = 1  # How many times the main loop runs per second
 ON_COURSE_THRESHOLD = 0.1  # Distance from target to be considered "On Course"
+TICK_SPIN_WINDOW = 0.002  # Seconds before each tick spent spin-waiting for precise timing
+NOISE_POOL_SIZE = 10000  # Random drift/sensor noise samples generated per batch
 
 # --- PID CONTROLLER GAINS ---
 # These values determine how the satellite corrects its course.
@@ -22,12 +28,15 @@ ON_COURSE_THRESHOLD = 0.1  # Distance from target to be considered "On Course"
 # Ki: Integral gain (corrects long-term error)
 # Kd: Derivative gain (dampens oscillations)
 PID_GAINS = {'Kp': 0.5, 'Ki': 0.01, 'Kd': 0.1}
+CORRECTION_CLAMP = 1e4  # Max magnitude of the correction per axis (anti-windup)
 
 # --- DATA & LOGGING LIMITS ---
 # Using a fixed size prevents memory usage from growing infinitely.
 TELEMETRY_LOG_MAX_SIZE = 1000
 HISTORY_LOG_MAX_SIZE = 500
 PLOT_DATA_MAX_POINTS = 100  # Max points to show on live graphs
+PLOT_MAX_DRAWN_POINTS = 1000  # Graphs with a larger PLOT_DATA_MAX_POINTS are decimated before drawing
+UI_REFRESH_INTERVAL_MS = 33  # How often the GUI polls for new simulation data (~30 Hz)
 
 # --- GUI APPEARANCE & THEME ---
 # Colors are centralized here for easy theme changes.
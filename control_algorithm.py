@@ -2,7 +2,7 @@
 control_algorithm.py
 
 Implements the PID controller for satellite station-keeping.
-Optimized to use NumPy for efficient vector calculations.
+Optimized to use scalar float math for the fixed-size 3D vectors.
 """
 import numpy as np
 from typing import List, Tuple
@@ -12,22 +12,34 @@ class PIDController:
     A Proportional-Integral-Derivative (PID) controller.
 
     This controller calculates a correction vector based on the difference
-    between a target location and the current location. It uses NumPy for
-    fast and efficient vector operations.
+    between a target location and the current location. The vectors are
+    always 3D, so the math is unrolled into scalar float operations, which
+    avoids the per-call overhead of creating NumPy arrays for tiny inputs.
+
+    The controller uses the incremental (velocity) form: each tick adds a
+    change to the previous output instead of re-summing an integral. The
+    output is clamped before it is stored, so a long drift cannot wind up
+    a huge correction (anti-windup) and resets are bumpless.
 
     Attributes:
         Kp (float): Proportional gain.
         Ki (float): Integral gain.
         Kd (float): Derivative gain.
+        deadband (float): Error magnitude below which no correction is computed.
+        output_limit (float): Per-axis clamp on the correction (anti-windup).
     """
-    def __init__(self, Kp: float, Ki: float, Kd: float):
+    # Fixed attribute layout for faster attribute access in the control loop
+    __slots__ = ('Kp', 'Ki', 'Kd', 'deadband', 'output_limit',
+                 '_ux', '_uy', '_uz', '_pex', '_pey', '_pez', '_ppex', '_ppey', '_ppez')
+
+    def __init__(self, Kp: float, Ki: float, Kd: float,
+                 deadband: float = 0.0, output_limit: float = float('inf')):
         self.Kp = Kp
         self.Ki = Ki
         self.Kd = Kd
-
-        # Internal state vectors, initialized as 3D NumPy arrays
-        self._integral = np.zeros(3)
-        self._previous_error = np.zeros(3)
+        self.deadband = deadband
+        self.output_limit = output_limit
+        self.reset()
 
     def compute_correction(self,
                            target_location: Tuple[float, float, float],
@@ -43,23 +55,57 @@ class PIDController:
         Returns:
             The calculated correction vector to be applied by the thrusters.
         """
-        # Convert inputs to NumPy arrays for vectorized operations
-        target = np.array(target_location)
-        current = np.array(current_location)
+        # --- PID Calculation (unrolled per axis) ---
+        ex = target_location[0] - current_location[0]
+        ey = target_location[1] - current_location[1]
+        ez = target_location[2] - current_location[2]
+
+        # Inside the deadband: skip the update so the controller state is untouched.
+        # With no deadband configured the squared norm is never computed.
+        deadband = self.deadband
+        if deadband > 0.0 and ex * ex + ey * ey + ez * ez < deadband * deadband:
+            return [0.0, 0.0, 0.0]
 
-        # --- PID Calculation ---
-        error = target - current
-        self._integral += error
-        derivative = error - self._previous_error
-        self._previous_error = error
+        # Load state and gains into locals once instead of repeated attribute lookups
+        Kp, Ki, Kd = self.Kp, self.Ki, self.Kd
+        pex, pey, pez = self._pex, self._pey, self._pez
+        limit = self.output_limit
 
-        # Calculate the final correction vector
-        correction = (self.Kp * error) + (self.Ki * self._integral) + (self.Kd * derivative)
+        # u_k = u_{k-1} + Kp*(e_k - e_{k-1}) + Ki*e_k + Kd*(e_k - 2*e_{k-1} + e_{k-2}),
+        # clamped with min/max rather than if/elif chains
+        ux = min(max(self._ux + Kp * (ex - pex) + Ki * ex + Kd * (ex - 2.0 * pex + self._ppex), -limit), limit)
+        uy = min(max(self._uy + Kp * (ey - pey) + Ki * ey + Kd * (ey - 2.0 * pey + self._ppey), -limit), limit)
+        uz = min(max(self._uz + Kp * (ez - pez) + Ki * ez + Kd * (ez - 2.0 * pez + self._ppez), -limit), limit)
 
-        # Convert back to a list for compatibility with other components
-        return correction.tolist()
+        self._ux, self._uy, self._uz = ux, uy, uz
+        self._ppex, self._ppey, self._ppez = pex, pey, pez
+        self._pex, self._pey, self._pez = ex, ey, ez
+
+        return [ux, uy, uz]
+
+    def batch_apply(self, targets: np.ndarray, currents: np.ndarray) -> np.ndarray:
+        """
+        Computes the corrections for a whole recorded trajectory in one pass.
+
+        Intended for replaying telemetry offline (e.g. when tuning gains).
+        The result matches calling compute_correction on each sample of a
+        freshly reset controller, without the deadband and output clamp.
+        The controller's own state is not modified.
+
+        Args:
+            targets: An (N, 3) array of target coordinates.
+            currents: An (N, 3) array of measured coordinates.
+
+        Returns:
+            An (N, 3) array of correction vectors.
+        """
+        error = np.asarray(targets, dtype=float) - np.asarray(currents, dtype=float)
+        integral = np.cumsum(error, axis=0)
+        derivative = np.diff(error, axis=0, prepend=np.zeros((1, 3)))
+        return self.Kp * error + self.Ki * integral + self.Kd * derivative
 
     def reset(self) -> None:
         """Resets the internal state of the controller."""
-        self._integral = np.zeros(3)
-        self._previous_error = np.zeros(3)
+        self._ux = self._uy = self._uz = 0.0
+        self._pex = self._pey = self._pez = 0.0
+        self._ppex = self._ppey = self._ppez = 0.0
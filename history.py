@@ -2,39 +2,108 @@
 history.py
 
 Records and manages the history of satellite drift and correction events.
-Optimized to use a deque with a fixed size to prevent infinite memory growth.
+Optimized to store events in fixed-size NumPy ring buffers (one column per
+field) to keep memory usage constant and event data contiguous.
 """
 import datetime
-from collections import deque
-from typing import Tuple, List, Optional
+import time
+import numpy as np
+from typing import Tuple, List
+
+class DriftEvent:
+    """A single drift-and-correction event, as returned by HistoryRecorder."""
+    __slots__ = ('timestamp', 'location', 'error_magnitude', 'correction_vector')
+
+    def __init__(self,
+                 timestamp: datetime.datetime,
+                 location: Tuple[float, float, float],
+                 error_magnitude: float,
+                 correction_vector: List[float]):
+        self.timestamp = timestamp
+        self.location = location
+        self.error_magnitude = error_magnitude
+        self.correction_vector = correction_vector
 
 class HistoryRecorder:
     """
-    Records drift events using a fixed-size deque for memory efficiency.
+    Records drift events in preallocated NumPy columns used as a ring buffer.
+    Once full, the oldest event is overwritten by the newest one.
     """
+    __slots__ = ('_max_size', '_timestamps', '_locations', '_error_magnitudes',
+                 '_correction_vectors', '_total', '_cleared_at', '_wall_clock_offset_ns')
+
     def __init__(self, max_history_size: int):
-        self._drift_history = deque(maxlen=max_history_size)
+        self._max_size = max_history_size
+        self._timestamps = np.empty(max_history_size, dtype=np.int64)  # time.monotonic_ns() values
+        self._locations = np.empty((max_history_size, 3), dtype=np.float64)
+        self._error_magnitudes = np.empty(max_history_size, dtype=np.float64)
+        self._correction_vectors = np.empty((max_history_size, 3), dtype=np.float64)
+        # Events recorded so far; event n is stored at row n % max_size.
+        # Only record_drift advances it, so the simulation thread is its sole writer.
+        self._total = 0
+        # Sequence number of the first event after the last clear; clearing moves
+        # this base instead of rewinding the counter the writer is incrementing
+        self._cleared_at = 0
+        # Converts monotonic timestamps to wall-clock time, only when displaying
+        self._wall_clock_offset_ns = time.time_ns() - time.monotonic_ns()
 
     def record_drift(self,
-                     timestamp: datetime.datetime,
+                     timestamp: int,
                      location: Tuple[float, float, float],
                      error_magnitude: float,
                      correction_vector: List[float]) -> None:
         """
         Records an event where the satellite drifted and was corrected.
+
+        Args:
+            timestamp: The event time as returned by time.monotonic_ns().
+            location: The satellite's position when the drift was detected.
+            error_magnitude: The distance from the target position.
+            correction_vector: The thrust vector applied.
+        """
+        i = self._total % self._max_size
+        self._timestamps[i] = timestamp
+        self._locations[i] = location
+        self._error_magnitudes[i] = error_magnitude
+        self._correction_vectors[i] = correction_vector
+        self._total += 1  # Publish the row only after it is fully written
+
+    def _build_events(self, rows) -> List[DriftEvent]:
+        """Builds DriftEvent objects for the given row selection (slice or index array)."""
+        timestamps = self._timestamps[rows] + self._wall_clock_offset_ns
+        return [
+            DriftEvent(datetime.datetime.fromtimestamp(ts / 1e9), tuple(loc), err, corr)
+            for ts, loc, err, corr in zip(timestamps.tolist(), self._locations[rows].tolist(),
+                                          self._error_magnitudes[rows].tolist(),
+                                          self._correction_vectors[rows].tolist())
+        ]
+
+    def get_drift_history(self) -> List[DriftEvent]:
+        """Returns the recorded drift events, oldest first."""
+        return self.get_drift_history_since(0)[0]
+
+    def get_drift_history_since(self, sequence: int) -> Tuple[List[DriftEvent], int]:
+        """
+        Returns the events recorded after a given point, oldest first.
+
+        Args:
+            sequence: 0, or the sequence number returned by the previous call.
+
+        Returns:
+            The new events and the sequence number to pass on the next call.
+        """
+        total = self._total
+        start = max(sequence, total - self._max_size, self._cleared_at)
+        rows = np.arange(start, total) % self._max_size
+        return self._build_events(rows), total
+
+    def clear_history(self) -> int:
+        """
+        Clears the recorded drift history.
+
+        Returns:
+            The sequence number to pass to get_drift_history_since to read
+            only the events recorded after the clear.
         """
-        drift_event = {
-            "timestamp": timestamp,
-            "location": location,
-            "error_magnitude": error_magnitude,
-            "correction_vector": correction_vector
-        }
-        self._drift_history.append(drift_event)
-
-    def get_drift_history(self) -> deque:
-        """Returns the deque of recorded drift events."""
-        return self._drift_history
-
-    def clear_history(self) -> None:
-        """Clears the recorded drift history."""
-        self._drift_history.clear()
+        self._cleared_at = self._total
+        return self._cleared_at
@@ -4,10 +4,14 @@ login.py
 Handles the user authentication window for the application.
 Optimized to use relative paths for assets, making it portable.
 """
+import hashlib
+import hmac
 import customtkinter as ctk
-from PIL import Image
-from tkinter import messagebox
-from config import ASSETS_PATH  # Use centralized config for paths
+from collections import OrderedDict
+from config import ASSETS_PATH, DRAFT_IMAGE_MAX_SIZE  # Use centralized config
+
+# SHA-256 digest of the accepted "username:password" pair
+_CREDENTIAL_HASH = hashlib.sha256(b"admin:123").digest()
 
 class LoginPage(ctk.CTk):
     """
@@ -22,20 +26,42 @@ class LoginPage(ctk.CTk):
         self.minsize(600, 400)
 
         # --- Load and store the original image using a relative path ---
+        # PIL is imported lazily so importing this module stays cheap
+        from PIL import Image
         self.original_bg_image = None
+        self._draft_bg_image = None
         try:
             image_path = ASSETS_PATH / "login.png"
-            self.original_bg_image = Image.open(image_path)
+            image = Image.open(image_path)
+            # Decode once and convert to a resampling-friendly mode up front,
+            # so resizes never re-read the file or convert per call
+            image.load()
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            self.original_bg_image = image
+            # A small copy made once, so draft frames during a drag never
+            # resample the full-resolution source
+            draft_image = image.copy()
+            draft_image.thumbnail(DRAFT_IMAGE_MAX_SIZE)
+            self._draft_bg_image = draft_image
         except FileNotFoundError:
             print(f"Warning: Login background image not found at '{image_path}'. Using a fallback color.")
             self.configure(fg_color="#1a1a1a")
 
+        # --- OPTIMIZATION: LRU cache of resized images keyed by window size ---
+        self._resize_cache = OrderedDict()
+        self._resize_cache_size = 8
+        self._last_size = (0, 0)
+
         # --- Background Label ---
         self.bg_label = ctk.CTkLabel(self, text="")
         self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
 
-        # Bind the resize event to handle the background image scaling
-        self.bind("<Configure>", self._resize_image)
+        # Bind the resize event to handle the background image scaling.
+        # OPTIMIZATION: Live resizes use a cheap draft filter; the final size is
+        # resampled with LANCZOS once the events settle.
+        self._resize_job = None
+        self.bind("<Configure>", self._schedule_resize)
 
         # --- Login Frame ---
         login_frame = ctk.CTkFrame(self, corner_radius=10, fg_color="#1a1a1a")
@@ -58,8 +84,20 @@ class LoginPage(ctk.CTk):
         # Initial call to set the background
         self._resize_image(None)
 
-    def _resize_image(self, event) -> None:
+    def _schedule_resize(self, event) -> None:
+        """
+        Renders a fast draft of the background on every <Configure> event and
+        schedules a single high-quality resize once the window stops changing.
+        """
+        self._resize_image(None, draft=True)
+        if self._resize_job:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(150, lambda: self._resize_image(None))
+
+    def _resize_image(self, event, draft: bool = False) -> None:
         """Dynamically resizes the background image to fit the window without distortion."""
+        if not draft:
+            self._resize_job = None
         if not self.original_bg_image:
             return  # No image to resize
 
@@ -69,27 +107,63 @@ class LoginPage(ctk.CTk):
         if new_width <= 1 or new_height <= 1:
             return # Avoid division by zero on minimize
 
+        # Skip tiny size changes while dragging; the current image still covers the window
+        if draft and abs(new_width - self._last_size[0]) < 4 and abs(new_height - self._last_size[1]) < 4:
+            return
+        self._last_size = (new_width, new_height)
+
+        # Reuse a previously resized (final quality) image for this window size
+        key = (new_width, new_height)
+        bg_image = self._resize_cache.get(key)
+        if bg_image is not None:
+            self._resize_cache.move_to_end(key)
+            self.bg_label.configure(image=bg_image)
+            self.bg_label.image = bg_image
+            return
+
+        bg_image = self._render_background(new_width, new_height, draft)
+        if not draft:
+            self._cache_background(key, bg_image)
+
+        self.bg_label.configure(image=bg_image)
+        self.bg_label.image = bg_image  # Keep a reference
+
+    def _render_background(self, width: int, height: int, draft: bool = False) -> ctk.CTkImage:
+        """Resizes the original image to cover a window of the given size."""
+        from PIL import Image
         # --- Resizing logic ---
         img_width, img_height = self.original_bg_image.size
-        aspect_ratio_window = new_width / new_height
+        aspect_ratio_window = width / height
         aspect_ratio_img = img_width / img_height
 
         if aspect_ratio_img > aspect_ratio_window:
-            resize_height = new_height
+            resize_height = height
             resize_width = int(resize_height * aspect_ratio_img)
         else:
-            resize_width = new_width
+            resize_width = width
             resize_height = int(resize_width / aspect_ratio_img)
 
-        bg_image_resized = self.original_bg_image.resize((resize_width, resize_height), Image.LANCZOS)
-        bg_image = ctk.CTkImage(light_image=bg_image_resized, size=(new_width, new_height))
+        # Drafts resample the small copy with BILINEAR, which is much cheaper
+        # than LANCZOS on the full image and good enough while resizing
+        if draft:
+            bg_image_resized = self._draft_bg_image.resize((resize_width, resize_height), Image.BILINEAR)
+        else:
+            bg_image_resized = self.original_bg_image.resize((resize_width, resize_height), Image.LANCZOS)
+        return ctk.CTkImage(light_image=bg_image_resized, size=(width, height))
 
-        self.bg_label.configure(image=bg_image)
-        self.bg_label.image = bg_image  # Keep a reference
+    def _cache_background(self, key: tuple, bg_image: ctk.CTkImage) -> None:
+        """Stores a final-quality background in the LRU cache."""
+        self._resize_cache[key] = bg_image
+        self._resize_cache.move_to_end(key)
+        if len(self._resize_cache) > self._resize_cache_size:
+            self._resize_cache.popitem(last=False)  # Evict the least recently used
 
     def attempt_login(self) -> None:
         """Validates credentials and proceeds if correct."""
-        if self.username_entry.get() == "admin" and self.password_entry.get() == "123":
+        credentials = f"{self.username_entry.get()}:{self.password_entry.get()}".encode()
+        # Constant-time comparison of the hashed credentials
+        if hmac.compare_digest(hashlib.sha256(credentials).digest(), _CREDENTIAL_HASH):
             self.on_login_success()
         else:
+            from tkinter import messagebox
             messagebox.showerror("Login Failed", "Invalid username or password.")
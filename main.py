@@ -6,14 +6,14 @@ Integrates all modules into a single interface.
 Optimized for performance, maintainability, and best practices.
 """
 import sys
+import math
 import time
-import datetime
 import threading
 from tkinter import END, scrolledtext
-from collections import deque
 import customtkinter as ctk
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.axes import Axes
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 # --- Import custom modules ---
@@ -22,11 +22,23 @@ from control_algorithm import PIDController
 from telemetry import TelemetrySystem
 from history import HistoryRecorder
 from orbit_simulation import OrbitSimulationFrame
+from ring_buffer import RingBuffer
 from login import LoginPage
 
 # --- Import centralized configuration ---
 import config
 
+# --- OPTIMIZATION: Telemetry panel layout, filled in with one format call per refresh ---
+TELEMETRY_TEMPLATE = (
+    "Timestamp: {log.timestamp}\n"
+    "Current Location: [{log.current_location[0]:.4f}, {log.current_location[1]:.4f}, {log.current_location[2]:.4f}]\n"
+    "Target Location: [{log.target_location[0]:.4f}, {log.target_location[1]:.4f}, {log.target_location[2]:.4f}]\n"
+    "Error Magnitude: {log.error_magnitude:.4f}\n"
+    "Correction Vector: {correction}\n"
+    "Is On Course: {log.is_on_course}\n"
+)
+VECTOR_TEMPLATE = "[{0:.4f}, {1:.4f}, {2:.4f}]"
+
 class SatelliteGUI(ctk.CTkToplevel):
     """
     Main application window for the satellite control system GUI.
@@ -42,21 +54,38 @@ class SatelliteGUI(ctk.CTkToplevel):
         self.my_sensor = Sensor(self.my_satellite)
         self.my_telemetry = TelemetrySystem(max_log_size=config.TELEMETRY_LOG_MAX_SIZE)
         self.my_history = HistoryRecorder(max_history_size=config.HISTORY_LOG_MAX_SIZE)
-        self.my_controller = PIDController(**config.PID_GAINS)
+        # No deadband here: main_loop only calls the controller when the satellite is off course
+        self.my_controller = PIDController(**config.PID_GAINS, output_limit=config.CORRECTION_CLAMP)
 
         # --- Simulation State ---
         self.loop_is_running = False
         self.recording_history = False
         self.loop_thread = None
         self.paused = True
+        self._resume_event = threading.Event()  # Set while the loop may run; the thread blocks on it while paused
+        self._stop_event = threading.Event()  # Set to interrupt the tick wait when the loop is stopped
         self.status_text = "Paused"
 
-        # --- OPTIMIZATION: Use deques for plot data to cap memory usage ---
-        self.drift_data = deque(maxlen=config.PLOT_DATA_MAX_POINTS)
-        self.correction_counts = deque(maxlen=config.PLOT_DATA_MAX_POINTS)
+        # --- OPTIMIZATION: Preallocated NumPy ring buffers for plot data ---
+        self.drift_data = RingBuffer(config.PLOT_DATA_MAX_POINTS)
+        self.correction_counts = RingBuffer(config.PLOT_DATA_MAX_POINTS)
+        self._x_axis = np.arange(config.PLOT_DATA_MAX_POINTS)
+        # Decimation stride, fixed by the buffer capacity; stays 1 (no decimation)
+        # unless the plot buffers are larger than PLOT_MAX_DRAWN_POINTS
+        self._plot_stride = -(-config.PLOT_DATA_MAX_POINTS // config.PLOT_MAX_DRAWN_POINTS)
+
+        # --- OPTIMIZATION: Cached plot backgrounds for blitting, keyed by Axes ---
+        self._plot_backgrounds = {}
+
+        # --- OPTIMIZATION: The simulation thread only flags new data; the GUI
+        # thread polls the flags at a fixed rate, independent of the tick rate ---
+        self._ui_dirty = False
+        self._history_dirty = False
+        self._history_sequence = 0  # Last drift event shown in the history panel
 
         self._setup_gui()
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.after(config.UI_REFRESH_INTERVAL_MS, self._poll_ui_updates)
 
     def _setup_gui(self) -> None:
         """Initializes the main GUI window and its components."""
@@ -125,16 +154,20 @@ class SatelliteGUI(ctk.CTkToplevel):
         self.fig_corr, self.ax_corr = self._create_plot_figure("Correction Count Over Time")
         self.ax_corr.set_xlabel("Simulation Ticks", color='white')
         self.ax_corr.set_ylabel("Total Corrections", color='white')
-        self.line_corr, = self.ax_corr.plot([], [], marker='o', color=config.CORRECTION_PLOT_COLOR)
+        self.line_corr, = self.ax_corr.plot([], [], marker='o', color=config.CORRECTION_PLOT_COLOR, animated=True)
         self.fig_corr.tight_layout() # Adjust layout AFTER adding labels
         self.canvas_corr = self.embed_plot(self.fig_corr, plots_tab, 0)
+        self._setup_blitting(self.canvas_corr, self.ax_corr, self.line_corr)
+        self.canvas_corr.mpl_connect('resize_event', lambda event: self.fig_corr.tight_layout())
 
         self.fig_drift, self.ax_drift = self._create_plot_figure("Orbital Drift Over Time")
         self.ax_drift.set_xlabel("Simulation Ticks", color='white')
         self.ax_drift.set_ylabel("Error Magnitude (km)", color='white')
-        self.line_drift, = self.ax_drift.plot([], [], marker='o', color=config.DRIFT_PLOT_COLOR)
+        self.line_drift, = self.ax_drift.plot([], [], marker='o', color=config.DRIFT_PLOT_COLOR, animated=True)
         self.fig_drift.tight_layout() # Adjust layout AFTER adding labels
         self.canvas_drift = self.embed_plot(self.fig_drift, plots_tab, 1)
+        self._setup_blitting(self.canvas_drift, self.ax_drift, self.line_drift)
+        self.canvas_drift.mpl_connect('resize_event', lambda event: self.fig_drift.tight_layout())
 
         # --- Orbit Simulation ---
         orbit_sim_frame = OrbitSimulationFrame(orbit_tab, fg_color="transparent")
@@ -142,7 +175,7 @@ class SatelliteGUI(ctk.CTkToplevel):
 
     def _create_plot_figure(self, title: str) -> tuple:
         """Helper to create a styled matplotlib Figure and Axes."""
-        fig = plt.Figure(figsize=(8, 4), facecolor=config.PLOT_BG_COLOR)
+        fig = Figure(figsize=(8, 4), facecolor=config.PLOT_BG_COLOR)
         ax = fig.add_subplot(111, facecolor=config.PLOT_BG_COLOR)
         ax.set_title(title, color='white')
         ax.tick_params(axis='x', colors='white')
@@ -151,26 +184,84 @@ class SatelliteGUI(ctk.CTkToplevel):
         ax.spines['top'].set_color('white')
         ax.spines['left'].set_color('white')
         ax.spines['right'].set_color('white')
+        # A fixed x-range means new points never force a full redraw
+        ax.set_xlim(0, config.PLOT_DATA_MAX_POINTS - 1)
         # The tight_layout call is removed from here to be called after labels are set
         return fig, ax
 
-    def embed_plot(self, fig: plt.Figure, parent: ctk.CTkFrame, row: int) -> FigureCanvasTkAgg:
+    def embed_plot(self, fig: Figure, parent: ctk.CTkFrame, row: int) -> FigureCanvasTkAgg:
         """Embeds a matplotlib figure into the Tkinter parent."""
         canvas = FigureCanvasTkAgg(fig, master=parent)
         canvas.get_tk_widget().grid(row=row, column=0, padx=10, pady=10, sticky="nsew")
         return canvas
 
+    def _setup_blitting(self, canvas: FigureCanvasTkAgg, ax: Axes, line) -> None:
+        """
+        Re-captures the static background of an Axes after every full draw
+        (initial paint, resize, rescale) so regular updates only blit the line.
+        """
+        def on_draw(event):
+            self._plot_backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(line)
+        canvas.mpl_connect('draw_event', on_draw)
+
+    @staticmethod
+    def _fit_y_limits(ax: Axes, values: np.ndarray) -> bool:
+        """
+        Rescales the y-axis only when the data leaves the view or fills too
+        little of it. Returns True if the limits changed.
+        """
+        low, high = values.min(), values.max()
+        view_low, view_high = ax.get_ylim()
+        span = high - low
+        fits = view_low <= low and high <= view_high
+        too_loose = span > 0 and span < 0.25 * (view_high - view_low)
+        if fits and not too_loose:
+            return False
+        padding = 0.1 * span if span > 0 else 1.0
+        ax.set_ylim(low - padding, high + padding)
+        return True
+
+    def _blit_line(self, canvas: FigureCanvasTkAgg, ax: Axes, line, data: RingBuffer) -> None:
+        """Updates a line plot, doing a full redraw only when the axes must change."""
+        values = data.view()
+        x_values = self._x_axis[:len(values)]
+        limits_changed = self._fit_y_limits(ax, values)  # Fit on all points, not the decimated ones
+        # Decimate with a strided view so the drawn point count stays bounded
+        stride = self._plot_stride
+        if stride > 1:
+            x_values, values = x_values[::stride], values[::stride]
+        line.set_data(x_values, values)
+        background = self._plot_backgrounds.get(ax)
+        if limits_changed or background is None:
+            # Invalidate the stale background; the draw_event handler re-captures it.
+            # draw_idle lets Tk coalesce redraw requests into a single render.
+            self._plot_backgrounds.pop(ax, None)
+            canvas.draw_idle()
+            return
+        canvas.restore_region(background)
+        ax.draw_artist(line)
+        canvas.blit(ax.bbox)
+
     # --- Control Logic ---
     def toggle_loop(self):
-        self.loop_is_running = not self.loop_is_running
-        if self.loop_is_running:
+        if not self.loop_is_running:
+            # A just-stopped thread wakes immediately; let it exit before starting a new one
+            if self.loop_thread and self.loop_thread.is_alive():
+                self.loop_thread.join(timeout=1.0)
+            self.loop_is_running = True
+            self._stop_event.clear()
             self.paused = False
+            self._resume_event.set()
             self.status_text = "Running"
             self.start_button.configure(text="Stop Loop")
             self.loop_thread = threading.Thread(target=self.main_loop, daemon=True)
             self.loop_thread.start()
         else:
+            self.loop_is_running = False
             self.paused = True
+            self._stop_event.set()
+            self._resume_event.set()  # Wake a paused thread so it can exit
             self.status_text = "Stopped"
             self.start_button.configure(text="Start Loop")
         self.status_label.configure(text=f"Status: {self.status_text}")
@@ -178,6 +269,10 @@ class SatelliteGUI(ctk.CTkToplevel):
     def toggle_pause(self):
         if self.loop_is_running:
             self.paused = not self.paused
+            if self.paused:
+                self._resume_event.clear()
+            else:
+                self._resume_event.set()
             self.status_text = "Paused" if self.paused else "Running"
             self.status_label.configure(text=f"Status: {self.status_text}")
 
@@ -187,89 +282,128 @@ class SatelliteGUI(ctk.CTkToplevel):
         self.history_button.configure(text=text)
 
     def clear_history(self):
-        self.my_history.clear_history()
+        # Resume from the recorder's new base rather than 0, so events recorded
+        # before the clear are never re-inserted into the emptied panel
+        self._history_sequence = self.my_history.clear_history()
         self.history_text.delete('1.0', END)
 
     # --- UI Update Methods ---
     def update_telemetry_display(self):
         latest_log = self.my_telemetry.get_latest_log()
         if not latest_log: return
+        correction = latest_log.correction_vector
+        text = TELEMETRY_TEMPLATE.format(
+            log=latest_log,
+            correction=VECTOR_TEMPLATE.format(*correction) if correction is not None else "None"
+        )
         self.telemetry_text.delete('1.0', END)
-        for key, value in latest_log.items():
-            if isinstance(value, (list, tuple, np.ndarray)):
-                val_str = ", ".join(f"{v:.4f}" for v in value)
-                self.telemetry_text.insert(END, f"{key.replace('_', ' ').title()}: [{val_str}]\n")
-            else:
-                self.telemetry_text.insert(END, f"{key.replace('_', ' ').title()}: {value}\n")
+        self.telemetry_text.insert(END, text)
 
     def update_history_display(self):
-        self.history_text.delete('1.0', END)
-        for event in self.my_history.get_drift_history():
-            ts = event['timestamp'].strftime('%H:%M:%S')
-            err = event['error_magnitude']
-            self.history_text.insert(END, f"[{ts}] Drift Detected! Error: {err:.4f}\n")
+        """OPTIMIZED: Appends only the drift events recorded since the last refresh."""
+        events, self._history_sequence = self.my_history.get_drift_history_since(self._history_sequence)
+        if not events: return
+        lines = "".join(
+            f"[{event.timestamp.strftime('%H:%M:%S')}] Drift Detected! Error: {event.error_magnitude:.4f}\n"
+            for event in events
+        )
+        self.history_text.insert(END, lines)
+        # Keep the panel capped to the recorder's size by dropping the oldest lines
+        line_count = int(self.history_text.index('end-1c').split('.')[0]) - 1  # Last line is empty
+        excess = line_count - config.HISTORY_LOG_MAX_SIZE
+        if excess > 0:
+            self.history_text.delete('1.0', f'{excess + 1}.0')
+        self.history_text.see(END)
 
     def update_plots(self):
-        """OPTIMIZED: Updates plot data without redrawing the entire figure."""
-        # Update Correction Plot
-        self.line_corr.set_data(range(len(self.correction_counts)), list(self.correction_counts))
-        self.ax_corr.relim()
-        self.ax_corr.autoscale_view()
-        self.fig_corr.tight_layout() # Re-adjust layout dynamically
-        self.canvas_corr.draw()
-
-        # Update Drift Plot
-        self.line_drift.set_data(range(len(self.drift_data)), list(self.drift_data))
-        self.ax_drift.relim()
-        self.ax_drift.autoscale_view()
-        self.fig_drift.tight_layout() # Re-adjust layout dynamically
-        self.canvas_drift.draw()
+        """OPTIMIZED: Blits only the data lines instead of redrawing the entire figures."""
+        self._blit_line(self.canvas_corr, self.ax_corr, self.line_corr, self.correction_counts)
+        self._blit_line(self.canvas_drift, self.ax_drift, self.line_drift, self.drift_data)
+
+    def _poll_ui_updates(self) -> None:
+        """
+        Refreshes the GUI panels with the latest simulation data, if any, then
+        reschedules itself. Runs on the Tk thread, so the simulation thread
+        never has to queue Tk callbacks and slow redraws simply skip ticks.
+        """
+        # Reschedule first so an error in one refresh cannot stop all later ones
+        self.after(config.UI_REFRESH_INTERVAL_MS, self._poll_ui_updates)
+        if self._ui_dirty:
+            self._ui_dirty = False
+            if self._history_dirty:
+                self._history_dirty = False
+                self.update_history_display()
+            self.update_telemetry_display()
+            self.update_plots()
 
     # --- Main Simulation Loop ---
     def main_loop(self):
         """The core simulation loop running in a separate thread."""
         correction_count = 0
         tick_duration = 1.0 / config.SIMULATION_TICK_RATE_HZ
+        target_location = tuple(float(v) for v in config.INITIAL_TARGET_LOCATION)
+        tx, ty, tz = target_location
+
+        next_deadline = time.monotonic()
+        sensed_location = np.empty(3)  # Reused buffer for the sensor reading
 
         while self.loop_is_running:
-            start_time = time.monotonic()
-            if self.paused:
-                time.sleep(0.1)
+            if not self._resume_event.is_set():
+                self._resume_event.wait()  # Blocks without polling until resumed or stopped
+                next_deadline = time.monotonic()  # Restart the tick schedule on resume
                 continue
 
+            # Sample the tick's timestamp once and reuse it for all logging;
+            # an integer clock read avoids building a datetime every tick
+            tick_time_ns = time.monotonic_ns()
+
             self.my_satellite.simulate_drift()
-            current_location = self.my_sensor.get_current_position()
-            target_location = config.INITIAL_TARGET_LOCATION
+            current_location = self.my_sensor.get_current_position(out=sensed_location)
 
-            distance_from_target = np.linalg.norm(np.array(target_location) - np.array(current_location))
+            # OPTIMIZATION: Plain float math avoids NumPy overhead on a 3-vector
+            current_xyz = current_location.tolist()
+            cx, cy, cz = current_xyz
+            dx, dy, dz = tx - cx, ty - cy, tz - cz
+            distance_from_target = math.sqrt(dx * dx + dy * dy + dz * dz)
             is_on_course = distance_from_target < config.ON_COURSE_THRESHOLD
 
             correction_vector = None
             if not is_on_course:
-                correction_vector = self.my_controller.compute_correction(target_location, current_location)
+                correction_vector = self.my_controller.compute_correction(target_location, current_xyz)
                 self.my_thruster.apply_thrust(self.my_satellite, correction_vector)
                 correction_count += 1
                 if self.recording_history:
-                    self.my_history.record_drift(datetime.datetime.now(), current_location, distance_from_target, correction_vector)
-                    self.after(0, self.update_history_display)
+                    self.my_history.record_drift(tick_time_ns, current_location, distance_from_target, correction_vector)
+                    self._history_dirty = True
 
             # Log data
             self.drift_data.append(distance_from_target)
             self.correction_counts.append(correction_count)
-            self.my_telemetry.log_status(datetime.datetime.now(), current_location, target_location, correction_vector, is_on_course)
-
-            # Schedule GUI updates on the main thread
-            self.after(0, self.update_telemetry_display)
-            self.after(0, self.update_plots)
-
-            # Ensure consistent loop timing
-            elapsed_time = time.monotonic() - start_time
-            sleep_time = max(0, tick_duration - elapsed_time)
-            time.sleep(sleep_time)
+            self.my_telemetry.log_status(tick_time_ns, current_location, target_location, correction_vector, is_on_course)
+
+            # Flag the new data for the GUI thread's next poll
+            self._ui_dirty = True
+
+            # Ensure consistent loop timing with a fixed tick schedule.
+            # If the tick overran, drop the missed frames instead of bursting to catch up.
+            next_deadline += tick_duration
+            now = time.monotonic()
+            if now > next_deadline:
+                missed = int((now - next_deadline) // tick_duration) + 1
+                next_deadline += missed * tick_duration
+            # Sleep for most of the wait, then spin for the last moment, since
+            # time.sleep alone can overshoot by several milliseconds
+            coarse_sleep = next_deadline - now - config.TICK_SPIN_WINDOW
+            if coarse_sleep > 0 and self._stop_event.wait(coarse_sleep):
+                break  # Stopped while waiting for the next tick
+            while time.monotonic() < next_deadline:
+                time.sleep(0)
 
     def on_closing(self):
         """Handles graceful application shutdown."""
         self.loop_is_running = False
+        self._stop_event.set()
+        self._resume_event.set()  # Wake a paused thread so it can exit
         if self.loop_thread and self.loop_thread.is_alive():
             self.loop_thread.join(timeout=1.0)
         self.login_root.destroy()  # Destroy the root window, which exits the mainloop
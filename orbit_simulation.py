@@ -4,12 +4,24 @@ orbit_simulation.py
 A GUI frame for visualizing a satellite's orbit in 3D.
 Optimized to animate plots efficiently by updating data instead of redrawing.
 """
+from functools import lru_cache
 import customtkinter as ctk
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from config import PLOT_BG_COLOR, ORBIT_PATH_COLOR, SATELLITE_COLOR, EARTH_COLOR
 
+@lru_cache(maxsize=None)
+def _earth_mesh(radius: float) -> tuple:
+    """Computes the Earth sphere surface mesh once per radius and shares it across frames."""
+    # A coarse 16x8 grid drawn at stride 1 (15x7 quads) is plenty for a stylized globe,
+    # about half the quads of the former 40x20 grid drawn at stride 2
+    u, v = np.mgrid[0:2*np.pi:16j, 0:np.pi:8j]
+    xe = radius * np.cos(u) * np.sin(v)
+    ye = radius * np.sin(u) * np.sin(v)
+    ze = radius * np.cos(v)
+    return xe, ye, ze
+
 class OrbitSimulationFrame(ctk.CTkFrame):
     """
     A high-performance GUI frame for simulating and visualizing a satellite's orbit.
@@ -34,19 +46,39 @@ class OrbitSimulationFrame(ctk.CTkFrame):
         # --- Control Frame ---
         self.controls_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.controls_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        self._update_job = None  # Pending debounced orbit redraw
+        self._last_params = None  # Slider values the current orbit was computed from
         self._setup_controls()
 
         # --- Orbit Parameters ---
         self.R_earth = 6371  # Radius of Earth in km
         self.theta_index = 0
         self.num_points = 360
+        self.is_animating = False
+        self._animate_job = None  # Pending animation tick
+
+        # --- OPTIMIZATION: Fixed anomaly angles and their trig tables, computed once ---
+        self._theta = np.linspace(0, 2 * np.pi, self.num_points)
+        self._cos_t = np.cos(self._theta)
+        self._sin_t = np.sin(self._theta)
+        # Orbital-plane coordinates (z stays 0) and the rotated 3D coordinates;
+        # x, y and z are row views into the rotated array
+        self._plane_xyz = np.zeros((3, self.num_points))
+        self._orbit_xyz = np.empty((3, self.num_points))
+        self.x, self.y, self.z = self._orbit_xyz
 
         # --- OPTIMIZATION: Create plot elements once ---
+        self._background = None  # Cached static frame for blitting the satellite
         self._setup_plot_elements()
 
         # Initial plot generation
         self.update_plot()
-        self.animate_satellite()
+
+        # OPTIMIZATION: Only animate while the frame is on screen; a hidden tab
+        # does not keep waking the Tk event loop
+        self.bind("<Map>", lambda event: self.start_animation(), add="+")
+        self.bind("<Unmap>", lambda event: self.stop_animation(), add="+")
+        self.start_animation()
 
     def _setup_controls(self) -> None:
         """Initializes all the control sliders and labels."""
@@ -61,7 +93,7 @@ class OrbitSimulationFrame(ctk.CTkFrame):
         frame = ctk.CTkFrame(self.controls_frame, fg_color="transparent")
         label = ctk.CTkLabel(frame, text=f"{text}: {initial_val}")
         label.pack(fill='x', padx=5)
-        slider = ctk.CTkSlider(frame, from_=from_, to=to, command=lambda val, l=label, t=text: self.update_plot(val, l, t))
+        slider = ctk.CTkSlider(frame, from_=from_, to=to, command=lambda val, l=label, t=text: self._on_slider(val, l, t))
         slider.set(initial_val)
         slider.pack(fill='x', expand=True, padx=5, pady=(0, 10))
         frame.pack(fill='x', pady=5)
@@ -70,15 +102,15 @@ class OrbitSimulationFrame(ctk.CTkFrame):
     def _setup_plot_elements(self) -> None:
         """Initializes static and dynamic plot elements for efficient animation."""
         # --- Static Earth Sphere ---
-        u, v = np.mgrid[0:2*np.pi:40j, 0:np.pi:20j]
-        xe = self.R_earth * np.cos(u) * np.sin(v)
-        ye = self.R_earth * np.sin(u) * np.sin(v)
-        ze = self.R_earth * np.cos(v)
-        self.axes.plot_surface(xe, ye, ze, color=EARTH_COLOR, alpha=0.6, rstride=2, cstride=2)
+        xe, ye, ze = _earth_mesh(self.R_earth)
+        self.axes.plot_surface(xe, ye, ze, color=EARTH_COLOR, alpha=0.6, rstride=1, cstride=1)
 
         # --- Dynamic Elements (placeholders) ---
         self.orbit_line, = self.axes.plot([], [], [], ORBIT_PATH_COLOR, label="Orbit Path", linewidth=2)
-        self.satellite_scatter = self.axes.scatter([], [], [], color=SATELLITE_COLOR, s=80, depthshade=True, label="Satellite")
+        # The satellite is a single-marker Line3D so it can be blitted on its own;
+        # unlike a scatter, it re-projects its 3D position whenever it is drawn
+        self.satellite_marker, = self.axes.plot([], [], [], 'o', color=SATELLITE_COLOR, markersize=9,
+                                                label="Satellite", animated=True)
 
         # --- Static Axis Setup ---
         self.axes.set_xlabel("X (km)", color='white', fontsize=10)
@@ -89,60 +121,115 @@ class OrbitSimulationFrame(ctk.CTkFrame):
         self.axes.tick_params(axis='z', colors='white')
         self.fig.tight_layout()
 
+        # Re-capture the background after every full draw (slider change, resize, rotation)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event) -> None:
+        """Caches the static scene and draws the satellite on top of it."""
+        self._background = self.canvas.copy_from_bbox(self.axes.bbox)
+        self.axes.draw_artist(self.satellite_marker)
+
     def compute_orbit(self, altitude: float, inclination: float, eccentricity: float) -> None:
         """Computes the 3D coordinates of the orbit."""
         a = self.R_earth + altitude
-        theta = np.linspace(0, 2 * np.pi, self.num_points)
-        r = a * (1 - eccentricity**2) / (1 + eccentricity * np.cos(theta))
-        self.x = r * np.cos(theta)
-        self.y = r * np.sin(theta)
-        self.z = np.zeros_like(self.x)
+        r = a * (1 - eccentricity**2) / (1 + eccentricity * self._cos_t)
+        np.multiply(r, self._cos_t, out=self._plane_xyz[0])
+        np.multiply(r, self._sin_t, out=self._plane_xyz[1])
 
+        # Tilt the orbital plane about the x-axis by the inclination.
+        # OPTIMIZED: A single matrix product written into the preallocated coordinates.
         inc_rad = np.deg2rad(inclination)
-        self.y = self.y * np.cos(inc_rad)
-        self.z = r * np.sin(theta) * np.sin(inc_rad)
+        cos_i, sin_i = np.cos(inc_rad), np.sin(inc_rad)
+        rotation = np.array([[1.0, 0.0, 0.0],
+                             [0.0, cos_i, -sin_i],
+                             [0.0, sin_i, cos_i]])
+        np.dot(rotation, self._plane_xyz, out=self._orbit_xyz)
 
     def plot_orbit(self) -> None:
         """
         OPTIMIZED: Updates the data of existing plot elements instead of redrawing.
         """
         # Update orbit path data
-        self.orbit_line.set_data(self.x, self.y)
-        self.orbit_line.set_3d_properties(self.z)
+        self.orbit_line.set_data_3d(self.x, self.y, self.z)
 
         # Update satellite position data
-        idx = self.theta_index % self.num_points
-        self.satellite_scatter._offsets3d = ([self.x[idx]], [self.y[idx]], [self.z[idx]])
+        idx = self.theta_index
+        self.satellite_marker.set_data_3d([self.x[idx]], [self.y[idx]], [self.z[idx]])
 
         # Rescale axes to fit the new orbit
-        max_range = np.max([self.x.max() - self.x.min(), self.y.max() - self.y.min(), self.z.max() - self.z.min()]) / 2.0
-        mid_x, mid_y, mid_z = np.mean(self.x), np.mean(self.y), np.mean(self.z)
+        # OPTIMIZED: One ptp and one mean over all three coordinate rows
+        max_range = np.ptp(self._orbit_xyz, axis=1).max() / 2.0
+        mid_x, mid_y, mid_z = self._orbit_xyz.mean(axis=1).tolist()
         self.axes.set_xlim(mid_x - max_range, mid_x + max_range)
         self.axes.set_ylim(mid_y - max_range, mid_y + max_range)
         self.axes.set_zlim(mid_z - max_range, mid_z + max_range)
 
-        # Redraw only the canvas, which is much faster
-        self.canvas.draw()
-
-    def update_plot(self, val=None, label_widget=None, text_prefix=None) -> None:
-        """Callback to re-compute and plot the orbit when sliders change."""
-        if label_widget and text_prefix:
-            label_widget.configure(text=f"{text_prefix}: {int(float(val))}")
+        # Schedule a redraw; draw_idle coalesces requests into a single paint
+        # on the next idle cycle instead of rendering synchronously. Drop the
+        # stale background so animation ticks don't blit over the old orbit.
+        self._background = None
+        self.canvas.draw_idle()
 
+    def _on_slider(self, val, label_widget, text_prefix) -> None:
+        """
+        Slider callback: updates the label right away and debounces the orbit
+        redraw, so a drag triggers one recompute instead of dozens.
+        """
+        label_widget.configure(text=f"{text_prefix}: {int(float(val))}")
+        if self._update_job:
+            self.after_cancel(self._update_job)
+        self._update_job = self.after(40, self.update_plot)
+
+    def update_plot(self) -> None:
+        """Re-computes and plots the orbit from the current slider values."""
+        self._update_job = None
         alt_val = self.altitude_slider.get()
         inc_val = self.inclination_slider.get()
         ecc_val = self.ecc_slider.get() / 100.0
 
+        # Skip the recompute and redraw if the orbit shape has not changed
+        params = (alt_val, inc_val, ecc_val)
+        if params == self._last_params:
+            return
+        self._last_params = params
+
         self.compute_orbit(alt_val, inc_val, ecc_val)
         self.plot_orbit()
 
-    def animate_satellite(self) -> None:
-        """Animates the satellite's movement along the pre-computed orbit."""
-        self.theta_index += 1
-        idx = self.theta_index % self.num_points
+    def start_animation(self) -> None:
+        """Starts the satellite animation loop if it is not already running."""
+        if self.is_animating:
+            return
+        self.is_animating = True
+        self._animate_job = self.after(50, self.animate_satellite)
 
-        # OPTIMIZED: Only update the satellite's 3D position
-        self.satellite_scatter._offsets3d = ([self.x[idx]], [self.y[idx]], [self.z[idx]])
-        self.canvas.draw_idle()  # Use draw_idle for smoother animation
+    def stop_animation(self) -> None:
+        """Stops the satellite animation loop."""
+        self.is_animating = False
+        if self._animate_job:
+            self.after_cancel(self._animate_job)
+            self._animate_job = None
 
-        self.after(50, self.animate_satellite)
+    def animate_satellite(self) -> None:
+        """Animates the satellite's movement along the pre-computed orbit."""
+        self._animate_job = None
+        if not self.is_animating:
+            return
+        if not self.winfo_ismapped():
+            self.stop_animation()  # Restarted by the <Map> binding
+            return
+
+        # Wrap the index so it stays bounded over long sessions
+        self.theta_index = (self.theta_index + 1) % self.num_points
+        idx = self.theta_index
+
+        # OPTIMIZED: Only update the satellite's 3D position and blit it over the cached scene
+        self.satellite_marker.set_data_3d([self.x[idx]], [self.y[idx]], [self.z[idx]])
+        if self._background is None:
+            self.canvas.draw_idle()  # No cached scene yet; the draw_event handler will capture it
+        else:
+            self.canvas.restore_region(self._background)
+            self.axes.draw_artist(self.satellite_marker)
+            self.canvas.blit(self.axes.bbox)
+
+        self._animate_job = self.after(50, self.animate_satellite)
@@ -0,0 +1,50 @@
+"""
+ring_buffer.py
+
+A fixed-capacity ring buffer backed by a preallocated NumPy array.
+Optimized for plot data: appends never allocate, and reading the contents
+reuses a single unwrap buffer instead of building a new list every frame.
+"""
+import numpy as np
+
+class RingBuffer:
+    """
+    Stores the most recent `capacity` values, discarding the oldest when full.
+    """
+    def __init__(self, capacity: int, dtype=np.float64):
+        self._capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._unwrapped = np.empty(capacity, dtype=dtype)
+        self._head = 0   # Index where the next value will be written
+        self._count = 0  # Number of valid values stored
+
+    def append(self, value: float) -> None:
+        """Adds a value, overwriting the oldest one if the buffer is full."""
+        self._buffer[self._head] = value
+        self._head = (self._head + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def view(self) -> np.ndarray:
+        """
+        Returns the stored values, oldest first.
+        The returned array is reused, so it is only valid until the next call.
+        """
+        # Snapshot the indices once; append() may run concurrently on the
+        # simulation thread, and mixing old and new values would misalign the slices
+        head = self._head
+        count = self._count
+        if count < self._capacity:
+            return self._buffer[:count]
+        split = self._capacity - head
+        self._unwrapped[:split] = self._buffer[head:]
+        self._unwrapped[split:] = self._buffer[:head]
+        return self._unwrapped
+
+    def clear(self) -> None:
+        """Removes all stored values."""
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
@@ -5,7 +5,13 @@ Defines the physical components of the satellite.
 Optimized to use NumPy for efficient location and vector calculations.
 """
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
+from config import NOISE_POOL_SIZE
+
+# OPTIMIZATION: One PCG64 generator shared by all components. Noise is drawn
+# in large batches and consumed one row per tick, so the per-tick cost is a
+# row lookup instead of a full RNG call.
+_rng = np.random.default_rng()
 
 class Satellite:
     """
@@ -15,6 +21,8 @@ class Satellite:
     def __init__(self, target_location: Tuple[float, float, float]):
         self._target_location = np.array(target_location, dtype=float)
         self._current_location = np.array(target_location, dtype=float)
+        self._drift_pool = _rng.uniform(-0.05, 0.05, (NOISE_POOL_SIZE, 3))
+        self._drift_index = 0
 
     def get_location(self) -> np.ndarray:
         """Returns the current location as a NumPy array."""
@@ -26,42 +34,58 @@ class Satellite:
 
     def simulate_drift(self) -> None:
         """Simulates gradual orbital drift by applying a random vector."""
-        # Generate a random 3D drift vector
-        drift_vector = np.random.uniform(-0.05, 0.05, 3)
-        self._current_location += drift_vector
+        # Take the next random 3D drift vector, refilling the pool when exhausted
+        if self._drift_index >= NOISE_POOL_SIZE:
+            self._drift_pool = _rng.uniform(-0.05, 0.05, (NOISE_POOL_SIZE, 3))
+            self._drift_index = 0
+        self._current_location += self._drift_pool[self._drift_index]
+        self._drift_index += 1
 
 class Thruster:
     """Represents the satellite's propulsion system."""
-    def apply_thrust(self, satellite: Satellite, correction_vector: List[float]) -> np.ndarray:
+    def apply_thrust(self, satellite: Satellite, correction_vector: Union[List[float], np.ndarray]) -> np.ndarray:
         """
         Applies a thrust to the satellite.
 
         Args:
             satellite: The satellite object to modify.
-            correction_vector: The vector to apply.
+            correction_vector: The vector to apply. A float64 ndarray is used
+                without copying; lists and tuples are converted.
 
         Returns:
             The new location of the satellite.
         """
-        current_location = satellite.get_location()
-        correction = np.array(correction_vector)
-        new_location = current_location + correction
-        satellite.set_location(new_location)
-        return new_location
+        # OPTIMIZATION: Update the location array in place instead of
+        # allocating a new array and swapping it in every tick
+        location = satellite.get_location()
+        location += np.asarray(correction_vector, dtype=np.float64)
+        return location
 
 class Sensor:
     """Simulates a sensor that provides the satellite's current position."""
     def __init__(self, satellite: Satellite):
         self._satellite = satellite
+        self._noise_pool = _rng.normal(0, 0.01, (NOISE_POOL_SIZE, 3))
+        self._noise_index = 0
 
-    def get_current_position(self) -> Tuple[float, float, float]:
+    def get_current_position(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Returns the satellite's current position.
         Introduces a small amount of simulated sensor noise.
+
+        Args:
+            out: Optional 3-element float64 array to write the reading into,
+                avoiding an allocation per call.
+
+        Returns:
+            The sensed position as a NumPy array (``out`` if it was given).
         """
-        # Get true location
+        # Get true location (the satellite's own array, read without copying)
         true_location = self._satellite.get_location()
         # Add a small random noise to simulate sensor inaccuracy
-        noise = np.random.normal(0, 0.01, 3)
-        sensed_location = true_location + noise
-        return tuple(sensed_location)
+        if self._noise_index >= NOISE_POOL_SIZE:
+            self._noise_pool = _rng.normal(0, 0.01, (NOISE_POOL_SIZE, 3))
+            self._noise_index = 0
+        sensed_location = np.add(self._noise_pool[self._noise_index], true_location, out=out)
+        self._noise_index += 1
+        return sensed_location
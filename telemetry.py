@@ -2,23 +2,44 @@
 telemetry.py
 
 Manages logging of real-time satellite telemetry data.
-Optimized to use a deque with a fixed size to prevent infinite memory growth.
+Optimized to store entries in fixed-size NumPy ring buffers (one column per
+field) to prevent infinite memory growth and keep the data contiguous.
 """
 import datetime
+import math
+import time
 import numpy as np
-from collections import deque
-from typing import Tuple, List, Optional
+from typing import Tuple, List, NamedTuple, Optional
+
+class TelemetryEntry(NamedTuple):
+    """A single telemetry sample; a tuple subclass, so it is compact and cheap to create."""
+    timestamp: datetime.datetime
+    current_location: Tuple[float, float, float]
+    target_location: Tuple[float, float, float]
+    error_magnitude: float
+    correction_vector: Optional[List[float]]
+    is_on_course: bool
 
 class TelemetrySystem:
     """
-    Manages telemetry logging using a fixed-size deque for efficiency.
+    Manages telemetry logging using preallocated NumPy columns as a ring buffer.
+    Once full, the oldest entry is overwritten by the newest one.
     """
     def __init__(self, max_log_size: int):
-        # A deque automatically discards old entries when the max size is reached.
-        self._telemetry_log = deque(maxlen=max_log_size)
+        self._max_size = max_log_size
+        self._timestamps = np.empty(max_log_size, dtype=np.int64)  # time.monotonic_ns() values
+        self._current_locations = np.empty((max_log_size, 3), dtype=np.float64)
+        self._target_locations = np.empty((max_log_size, 3), dtype=np.float64)
+        self._error_magnitudes = np.empty(max_log_size, dtype=np.float64)
+        self._correction_vectors = np.empty((max_log_size, 3), dtype=np.float64)  # NaN when no correction
+        self._on_course = np.empty(max_log_size, dtype=bool)
+        # Entries logged so far; entry n is stored at row n % max_size
+        self._total = 0
+        # Converts monotonic timestamps to wall-clock time, only when displaying
+        self._wall_clock_offset_ns = time.time_ns() - time.monotonic_ns()
 
     def log_status(self,
-                   timestamp: datetime.datetime,
+                   timestamp: int,
                    current_location: Tuple[float, float, float],
                    target_location: Tuple[float, float, float],
                    correction_vector: Optional[List[float]],
@@ -27,28 +48,77 @@ class TelemetrySystem:
         Records a new telemetry entry.
 
         Args:
-            timestamp: The timestamp of the log entry.
+            timestamp: The time of the entry in time.monotonic_ns() nanoseconds.
             current_location: The satellite's current position.
             target_location: The satellite's target position.
             correction_vector: The thrust vector applied, if any.
             is_on_course: Boolean indicating if the satellite is within tolerance.
         """
-        current_loc_np = np.array(current_location)
-        target_loc_np = np.array(target_location)
-
-        # Calculate error magnitude using NumPy for efficiency
-        error_magnitude = np.linalg.norm(target_loc_np - current_loc_np)
-
-        entry = {
-            "timestamp": timestamp,
-            "current_location": current_location,
-            "target_location": target_location,
-            "error_magnitude": error_magnitude,
-            "correction_vector": correction_vector,
-            "is_on_course": is_on_course
-        }
-        self._telemetry_log.append(entry)
-
-    def get_latest_log(self) -> Optional[dict]:
+        # Calculate error magnitude with scalar math; for a 3-vector this is
+        # much cheaper than building arrays and calling np.linalg.norm
+        dx = target_location[0] - current_location[0]
+        dy = target_location[1] - current_location[1]
+        dz = target_location[2] - current_location[2]
+        error_magnitude = math.sqrt(dx * dx + dy * dy + dz * dz)
+
+        i = self._total % self._max_size
+        self._timestamps[i] = timestamp
+        self._current_locations[i] = current_location
+        self._target_locations[i] = target_location
+        self._error_magnitudes[i] = error_magnitude
+        self._correction_vectors[i] = correction_vector if correction_vector is not None else np.nan
+        self._on_course[i] = is_on_course
+        self._total += 1  # Publish the row only after it is fully written
+
+    def log_batch(self,
+                  timestamps: np.ndarray,
+                  current_locations: np.ndarray,
+                  target_locations: np.ndarray,
+                  correction_vectors: np.ndarray,
+                  is_on_course: np.ndarray) -> None:
+        """
+        Records many telemetry entries at once with vectorized column writes.
+
+        Args:
+            timestamps: (N,) array of time.monotonic_ns() timestamps.
+            current_locations: (N, 3) array of the satellite's positions.
+            target_locations: (N, 3) array of target positions.
+            correction_vectors: (N, 3) array of applied thrust, NaN rows where none was applied.
+            is_on_course: (N,) boolean array.
+        """
+        current = np.asarray(current_locations, dtype=np.float64)
+        target = np.asarray(target_locations, dtype=np.float64)
+        n = len(current)
+        if not (len(timestamps) == len(target) == len(correction_vectors) == len(is_on_course) == n):
+            raise ValueError("All telemetry batch arrays must have the same length.")
+        if n > self._max_size:  # Only the newest entries would survive anyway
+            skip = n - self._max_size
+            self._total += skip
+            self.log_batch(timestamps[skip:], current[skip:], target[skip:],
+                           correction_vectors[skip:], is_on_course[skip:])
+            return
+
+        diff = target - current
+        rows = (self._total + np.arange(n)) % self._max_size
+        self._timestamps[rows] = timestamps
+        self._current_locations[rows] = current
+        self._target_locations[rows] = target
+        self._error_magnitudes[rows] = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        self._correction_vectors[rows] = correction_vectors
+        self._on_course[rows] = is_on_course
+        self._total += n
+
+    def get_latest_log(self) -> Optional[TelemetryEntry]:
         """Returns the most recent telemetry entry, or None if empty."""
-        return self._telemetry_log[-1] if self._telemetry_log else None
+        if not self._total:
+            return None
+        i = (self._total - 1) % self._max_size
+        correction = self._correction_vectors[i]
+        return TelemetryEntry(
+            datetime.datetime.fromtimestamp((self._timestamps[i].item() + self._wall_clock_offset_ns) / 1e9),
+            tuple(self._current_locations[i].tolist()),
+            tuple(self._target_locations[i].tolist()),
+            self._error_magnitudes[i].item(),
+            None if np.isnan(correction[0]) else correction.tolist(),
+            bool(self._on_course[i])
+        )